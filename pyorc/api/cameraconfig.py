@@ -486,8 +486,12 @@ class CameraConfig:
             # h_ref = self.gcps["h_ref"]
         z_dry = depth <= 0
         z_dry[[0, -1]] = True
-        # compute distance to nearest dry points with Pythagoras
-        dist_shore = np.array([(((x[z_dry] - _x) ** 2 + (y[z_dry] - _y) ** 2) ** 0.5).min() for _x, _y, in zip(x, y)])
+        # compute distance to nearest dry points with Pythagoras, for all points against all dry points at once
+        x, y = np.asarray(x), np.asarray(y)
+        dist_shore = np.hypot(
+            np.subtract.outer(x, x[z_dry]),
+            np.subtract.outer(y, y[z_dry])
+        ).min(axis=1)
         return dist_shore
 
     def get_dist_wall(
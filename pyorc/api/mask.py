@@ -139,7 +139,7 @@ class _Velocimetry_MaskMethods:
         maximum scalar velocity [m s-1] (default: 5.)
 
         """
-        s = (self[v_x] ** 2 + self[v_y] ** 2) ** 0.5
+        s = np.hypot(self[v_x], self[v_y])
         # create filter
         mask = (s > s_min) & (s < s_max)
         return mask
@@ -263,7 +263,7 @@ class _Velocimetry_MaskMethods:
     wdw : int, optional
         amount of time steps in rolling window (centred) (default: 5)
         """
-        s = (self[v_x] ** 2 + self[v_y] ** 2) ** 0.5
+        s = np.hypot(self[v_x], self[v_y])
         s_rolling = s.fillna(0.).rolling(time=wdw, center=True).max()
         mask = s > tolerance * s_rolling
         return mask
@@ -314,8 +314,6 @@ class _Transect_PlotMethods:
             scalar velocity
 
         """
-        v_eff = "v_eff"
-        v_dir = "v_dir"
         # retrieve the backward transformation array
         transect = self._obj.transect
         camera_config = transect.camera_config
@@ -327,20 +325,20 @@ class _Transect_PlotMethods:
         M = cv.get_M_2D(src, dst, reverse=True)
         # M = transect.camera_config.get_M(transect.h_a, reverse=True, to_bbox_grid=True)
 
-        x, y = self._obj.x, self._obj.y
-        _u = self._obj[v_eff] * np.sin(self._obj[v_dir])
-        _v = self._obj[v_eff] * np.cos(self._obj[v_dir])
-        s = np.abs(self._obj[v_eff].values)
+        x, y = self._obj.x.values, self._obj.y.values
+        # reuse the local velocity components, so that trigonometry on the flow direction is done only once
+        _u, _v, s = self.get_uv_local()
+        s = np.abs(s)
         x_moved, y_moved = x + _u * dt, y + _v * dt
-        xp, yp = transect.get_xyz_perspective(M=M, xs=x.values, ys=y.values)
-        xp_moved, yp_moved = transect.get_xyz_perspective(M=M, xs=x_moved.values, ys=y_moved.values)
+        xp, yp = transect.get_xyz_perspective(M=M, xs=x, ys=y)
+        xp_moved, yp_moved = transect.get_xyz_perspective(M=M, xs=x_moved, ys=y_moved)
         # remove vectors that have nan on moved pixels
         xp_moved[np.isnan(x_moved)] = np.nan
         yp_moved[np.isnan(y_moved)] = np.nan
 
         self._obj["xp"][:] = xp[:]
         self._obj["yp"][:] = yp[:]
-        u, v = xp_moved - self._obj["xp"], yp_moved - self._obj["yp"]
+        u, v = xp_moved - self._obj["xp"].values, yp_moved - self._obj["yp"].values
         return u, v, s
 
 
@@ -358,14 +356,15 @@ class _Transect_PlotMethods:
         """
         v_eff = "v_eff"
         v_dir = "v_dir"
-        u = self._obj[v_eff] * np.sin(self._obj[v_dir])
-        v = self._obj[v_eff] * np.cos(self._obj[v_dir])
-        s = self._obj[v_eff]
+        s = self._obj[v_eff].values
         aff = self.transect.camera_config.transform
         theta = np.arctan2(aff.d, aff.a)
         # rotate velocity vectors along angle theta to match the requested projection. this only changes values
-        # in case of camera projections
-        u, v = helpers.rotate_u_v(u, v, theta)
+        # in case of camera projections. Counter clockwise rotation of a vector equals reducing its direction by theta,
+        # so rotated components are computed directly from the direction instead of rotating u and v.
+        v_dir_rot = self._obj[v_dir].values - theta
+        u = s * np.sin(v_dir_rot)
+        v = s * np.cos(v_dir_rot)
         return u, v, s
 
 
@@ -383,9 +382,9 @@ class _Transect_PlotMethods:
         """
         v_eff = "v_eff"
         v_dir = "v_dir"
-        u = self._obj[v_eff] * np.sin(self._obj[v_dir])
-        v = self._obj[v_eff] * np.cos(self._obj[v_dir])
-        s = self._obj[v_eff]
+        s = self._obj[v_eff].values
+        u = s * np.sin(self._obj[v_dir].values)
+        v = s * np.cos(self._obj[v_dir].values)
         return u, v, s
 
 
@@ -433,7 +432,7 @@ class _Velocimetry_PlotMethods:
         velocimetry = self._obj.velocimetry
         u = self._obj["v_x"]
         v = -self._obj["v_y"]
-        s = (u**2 + v**2)**0.5
+        s = np.hypot(u, v)
         aff = velocimetry.camera_config.transform
         theta = np.arctan2(aff.d, aff.a)
         # rotate velocity vectors along angle theta to match the requested projection. this only changes values
@@ -456,7 +455,7 @@ class _Velocimetry_PlotMethods:
         """
         u = self._obj["v_x"].values
         v = -self._obj["v_y"].values
-        s = (u**2 + v**2)**0.5
+        s = np.hypot(u, v)
         return u, v, s
 
 
@@ -520,7 +519,7 @@ class _Velocimetry_PlotMethods:
         u, v = xp_moved - xp, yp_moved - yp
         self._obj["xp"][:] = xp[:]
         self._obj["yp"][:] = yp[:]
-        s = ((self._obj["v_x"] ** 2 + self._obj["v_y"] ** 2) ** 0.5).values
+        s = np.hypot(self._obj["v_x"].values, self._obj["v_y"].values)
         return u, v, s
 
 
@@ -1,6 +1,7 @@
 import numpy as np
 import xarray as xr
 
+from scipy.integrate import trapezoid
 from xarray.core import utils
 
 from pyorc import helpers
@@ -40,22 +41,16 @@ class Transect(ORCBase):
             velocities perpendicular to cross section [time, points]
 
         """
-        xs = self._obj["x"].values
-        ys = self._obj["y"].values
-        # find points that are located on the area of interest
-        idx = np.isfinite(xs)
-        xs = xs[idx]
-        ys = ys[idx]
-        # compute per velocity vector in the dataset, what its angle is
-        v_angle = np.arctan2(self._obj[v_x], self._obj[v_y])
-        # compute the scalar value of velocity
-        v_scalar = (self._obj[v_x] ** 2 + self._obj[v_y] ** 2) ** 0.5
-
-        # compute difference in angle between velocity and perpendicular of cross section
+        # compute sine and cosine of the perpendicular of the cross section only once per point, retaining the
+        # precision of the velocities
         flow_dir = self._obj["v_dir"]
-        angle_diff = v_angle - flow_dir
-        # compute effective velocity in the flow direction (i.e. perpendicular to cross section)
-        v_eff = np.cos(angle_diff) * v_scalar
+        dtype = self._obj[v_x].dtype
+        sin_dir = np.sin(flow_dir).astype(dtype)
+        cos_dir = np.cos(flow_dir).astype(dtype)
+        # compute effective velocity in the flow direction (i.e. perpendicular to cross section). This is the
+        # projection cos(arctan2(v_x, v_y) - flow_dir) * |v|, which simplifies to v_x * sin(flow_dir) +
+        # v_y * cos(flow_dir), without trigonometry on the velocity vectors themselves
+        v_eff = self._obj[v_x] * sin_dir + self._obj[v_y] * cos_dir
         v_eff.attrs = {
             "standard_name": "velocity",
             "long_name": "velocity in perpendicular direction of cross section, measured by angle in radians, "
@@ -93,37 +88,31 @@ class Transect(ORCBase):
             xs = self._obj.x.values
         if ys is None:
             ys = self._obj.y.values
-        # compute bathymetry as measured in local height reference (such as staff gauge)
-        if self.camera_config.gcps["h_ref"] is None:
-            h_ref = 0.
-        else:
-            h_ref = self.camera_config.gcps["h_ref"]
-        hs = self.camera_config.z_to_h(self._obj.zcoords).values
-        # zs = (self._obj.zcoords - self.camera_config.gcps["z_0"] + h_ref).values
+        # retrieve camera properties only once
+        camera_config = self.camera_config
+        shape_y, shape_x = self.camera_shape
         if M is None:
-            Ms = [self.camera_config.get_M(h, reverse=True, to_bbox_grid=True) for h in hs]
-        else:
-            # use user defined M instead
-            Ms = [M for _ in hs]
+            # compute bathymetry as measured in local height reference (such as staff gauge)
+            hs = camera_config.z_to_h(self._obj.zcoords).values
+            # many points share the same height, so only derive transformation matrices for unique heights (rounded to
+            # 0.1 mm), and stack these per point to transform all points in one go
+            hs_unique, idx = np.unique(np.round(hs, 4), return_inverse=True)
+            M = np.stack([camera_config.get_M(h, reverse=True, to_bbox_grid=True) for h in hs_unique])[idx]
         # compute row and column position of vectors in original reprojected background image col/row coordinates
-        cols, rows = zip(*[
-            helpers.xy_to_perspective(
-                x,
-                y,
-                self.camera_config.resolution,
-                M,
-                reverse_y=self.camera_config.shape[0]
-            ) for x, y, M in zip(xs, ys, Ms)
-        ])
+        cols, rows = helpers.xy_to_perspective(
+            np.array(xs, dtype=np.float64),
+            np.array(ys, dtype=np.float64),
+            camera_config.resolution,
+            M,
+            reverse_y=camera_config.shape[0]
+        )
 
         # ensure y coordinates start at the top in the right orientation
-        shape_y, shape_x = self.camera_shape
-        rows = shape_y - np.array(rows)
-        cols = np.array(cols)
+        rows = shape_y - rows
         if mask_outside:
             # remove values that do not fit in the frames
-            cols[np.any([cols < 0, cols > self.camera_shape[1]], axis=0)] = np.nan
-            rows[np.any([rows < 0, rows > self.camera_shape[0]], axis=0)] = np.nan
+            cols[(cols < 0) | (cols > shape_x)] = np.nan
+            rows[(rows < 0) | (rows > shape_y)] = np.nan
 
         return cols, rows
 
@@ -144,8 +133,17 @@ class Transect(ORCBase):
         """
         if "q" not in self._obj:
             raise ValueError(f'Dataset must contain variable "{q_name}", which is the depth-integrated velocity [m2 s-1], perpendicular to cross-section. Create this with ds.transect.get_q')
-        # integrate over the distance coordinates (s-coord)
-        Q = self._obj[q_name].fillna(0.0).integrate(coord="scoords")
+        q = self._obj[q_name]
+        # integrate over the distance coordinates (s-coord), missing values are treated as zero flow
+        Q = xr.apply_ufunc(
+            trapezoid,
+            q.fillna(0.0),
+            q["scoords"],
+            input_core_dims=[["points"], ["points"]],
+            kwargs={"axis": -1},
+            dask="parallelized",
+            output_dtypes=[q.dtype]
+        )
         Q.attrs = {
             "standard_name": "river_discharge",
             "long_name": "River Flow",
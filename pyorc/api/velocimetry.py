@@ -73,7 +73,8 @@ class Velocimetry(ORCBase):
             wdw_y_max=None,
             rolling=None,
             tolerance=0.5,
-            quantiles=[0.05, 0.25, 0.5, 0.75, 0.95]
+            quantiles=[0.05, 0.25, 0.5, 0.75, 0.95],
+            skipna=True
     ):
         """Interpolate all variables to supplied x and y coordinates of a cross section. This function assumes that the
         grid can be rotated and that xs and ys are supplied following the projected coordinates supplied in
@@ -125,6 +126,10 @@ class Velocimetry(ORCBase):
             if set other than None (default), a rolling mean over time is applied, before deriving quantile estimates.
         quantiles : list of floats (0-1), optional
             list of quantiles to return (default: [0.05, 0.25, 0.5, 0.75, 0.95]).
+        skipna : boolean, optional
+            if True (default), missing values are skipped when deriving quantile estimates. If False, the much faster
+            ``np.quantile`` is used instead of ``np.nanquantile``, but any point with a missing value in time will
+            result in missing quantiles. Only use this on time series that are complete (e.g. after filling gaps).
 
         Returns
         -------
@@ -196,6 +201,10 @@ class Velocimetry(ORCBase):
                 ds_effective[coord] = ds_effective[coord].astype(np.float64)
 
             ds_points = ds_effective.interp(x=_x, y=_y)
+        # interpolation is done, return velocities to single precision, which is ample for PIV results and halves
+        # the memory used for the time series in rolling and quantile computations
+        for var in ["v_x", "v_y"]:
+            ds_points[var] = ds_points[var].astype(np.float32)
         if np.isnan(ds_points["v_x"].mean(dim="time")).all():
             warnings.warn(
                 "No valid velocimetry points found over bathymetry. Check if the bathymetry is within the camera "
@@ -209,8 +218,9 @@ class Velocimetry(ORCBase):
         if z is not None:
             ds_points = ds_points.assign_coords(zcoords=("points", list(z)))
         # add mean angles to dataset
-        alpha = helpers.xy_angle(ds_points["x"], ds_points["y"])
-        flow_dir = alpha - 0.5 * np.pi
+        flow_dir = helpers.xy_angle(ds_points["x"], ds_points["y"])
+        # flow direction is perpendicular to the cross section, rotate in place
+        flow_dir -= 0.5 * np.pi
         ds_points["v_dir"] = (("points"), flow_dir)
         ds_points["v_dir"].attrs = {
             "standard_name": "river_flow_angle",
@@ -221,9 +231,12 @@ class Velocimetry(ORCBase):
         ds_points = xr.Dataset(ds_points, attrs=ds_points.attrs)
         if rolling is not None:
             ds_points = ds_points.rolling(time=rolling, min_periods=1).mean()
+        if any(ds_points[var].chunks is not None for var in ds_points.data_vars):
+            # quantiles are computed per chunk, which requires dask-backed data to have a single chunk in time
+            ds_points = ds_points.chunk({"time": -1})
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=RuntimeWarning)
-            ds_points = ds_points.quantile(quantiles, dim="time", keep_attrs=True)
+            ds_points = ds_points.quantile(quantiles, dim="time", skipna=skipna, keep_attrs=True)
         if v_eff:
             # add the effective velocity, perpendicular to cross-section direction
             ds_points.transect.vector_to_scalar()
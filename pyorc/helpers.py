@@ -59,8 +59,8 @@ def depth_integrate(depth, v, v_corr=0.85, name="q"):
     q: DataArray (time, points)
         depth integrated velocity [m2 s-1]
     """
-    # compute the depth average velocity
-    q = v * v_corr * depth
+    # compute the depth average velocity, combine the per-point factors first so that only one pass over v is needed
+    q = v * (v_corr * depth)
     q.attrs = {
         "standard_name": "velocity_depth",
         "long_name": "velocity averaged over depth",
@@ -460,15 +460,17 @@ def velocity_log_fit(v, depth, dist_shore, dim="quantile"):
     """
 
     def log_fit(_v):
+        valid = np.isfinite(_v).values
+        missing = np.isnan(_v).values
         pars = optimize_log_profile(
-            depth[np.isfinite(_v).values],
-            _v[np.isfinite(_v).values],
-            dist_shore[np.isfinite(_v).values]
+            depth[valid],
+            _v[valid],
+            dist_shore[valid]
         )
-        _v[np.isnan(_v).values] = log_profile(
+        _v[missing] = log_profile(
             (
-                depth[np.isnan(_v).values],
-                dist_shore[np.isnan(_v).values]
+                depth[missing],
+                dist_shore[missing]
             ),
             **pars
         )
@@ -502,15 +504,19 @@ def velocity_log_interp(v, dist_wall, d_0=0.1, dim="quantile"):
 
     """
 
+    # log of distance to the wall over roughness length is equal for all groups, so compute only once
+    log_dist = np.log(np.maximum(dist_wall, d_0) / d_0)
+
     def log_interp(_v):
         # scale with log depth
-        c = xr.DataArray(_v / np.log(np.maximum(dist_wall, d_0) / d_0))
+        c = xr.DataArray(_v / log_dist)
         # fill dry points with the nearest valid value for c
         c[dist_wall == 0] = c.interpolate_na(dim="points", method="nearest", fill_value="extrapolate")[dist_wall == 0]
         # interpolate with linear interpolation
         c = c.interpolate_na(dim="points")
         # use filled c to interpret missing v
-        _v[np.isnan(_v)] = (np.log(np.maximum(dist_wall, d_0) / d_0) * c)[np.isnan(_v)]
+        missing = np.isnan(_v)
+        _v[missing] = (log_dist * c)[missing]
         return _v
 
     # fill per grouped dimension
@@ -554,7 +560,7 @@ def xy_equidistant(x, y, distance, z=None):
     # estimate cumulative distance between points, starting with zero
     x_diff = np.concatenate((np.array([0]), np.diff(x)))
     y_diff = np.concatenate((np.array([0]), np.diff(y)))
-    s = np.cumsum((x_diff ** 2 + y_diff ** 2) ** 0.5)
+    s = np.cumsum(np.hypot(x_diff, y_diff))
 
     # create interpolation functions for x and y coordinates
     f_x = interp1d(s, x, fill_value="extrapolate")
@@ -588,13 +594,21 @@ def xy_angle(x, y):
     -------
     angle : np.ndarray (1D)
         angle between the point left and right of the point under consideration. The most left and right coordinates
-        are based on the first and last 2 points respectively
+        are based on the first and last 2 points respectively. Neighbouring points with coordinates identical to the
+        point under consideration are skipped, so that the nearest distinct neighbours are used.
     """
-    angles = np.zeros(len(x))
-    angles[1:-1] = np.arctan2(x[2:] - x[0:-2], y[2:] - y[0:-2])
-    angles[0] = np.arctan2(x[1] - x[0], y[1] - y[0])
-    angles[-1] = np.arctan2(x[-1] - x[-2], y[-1] - y[-2])
-    return angles
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    idx = np.arange(len(x))
+    # find points that are duplicates of their predecessor
+    same = (x[1:] == x[:-1]) & (y[1:] == y[:-1])
+    # index of first point of each run of duplicates, left neighbour is the point before that run
+    run_start = np.maximum.accumulate(np.where(np.r_[True, ~same], idx, 0))
+    left = np.maximum(run_start - 1, 0)
+    # index of last point of each run of duplicates, right neighbour is the point after that run
+    run_end = np.minimum.accumulate(np.where(np.r_[~same, True], idx, len(x) - 1)[::-1])[::-1]
+    right = np.minimum(run_end + 1, len(x) - 1)
+    return np.arctan2(x[right] - x[left], y[right] - y[left])
 
 
 def xy_to_perspective(x, y, resolution, M, reverse_y=None):
@@ -611,7 +625,10 @@ def xy_to_perspective(x, y, resolution, M, reverse_y=None):
     resolution : float
         resolution of original projected frames coordinates of x and y
     M : np.ndarray
-        2x3 transformation matrix (generated with cv2.getPerspectiveTransform)
+        3x3 transformation matrix (generated with cv2.getPerspectiveTransform), or stack of 3x3 transformation
+        matrices (N x 3 x 3) with one matrix per x, y coordinate
+    reverse_y : int, optional
+        if set, rows are counted from the bottom, using reverse_y as number of rows (default: None)
 
     Returns
     -------
@@ -623,6 +640,15 @@ def xy_to_perspective(x, y, resolution, M, reverse_y=None):
     cols, rows = x / resolution - 0.5, y / resolution - 0.5
     if reverse_y is not None:
         rows = reverse_y - rows
+    if M.ndim == 3:
+        assert(M.shape[0] == cols.size), f"Amount of transformation matrices ({M.shape[0]}) must be equal to the " \
+                                         f"amount of coordinates ({cols.size})"
+        # one matrix per coordinate, transform all homogeneous coordinates at once
+        coords = np.stack([cols.flatten(), rows.flatten(), np.ones(cols.size)], axis=-1)
+        coords_trans = np.einsum("nij,nj->ni", M, coords)
+        xp = (coords_trans[:, 0] / coords_trans[:, 2]).reshape(cols.shape)
+        yp = (coords_trans[:, 1] / coords_trans[:, 2]).reshape(cols.shape)
+        return xp, yp
     # make list of coordinates, compatible with cv2.perspectiveTransform
     coords = np.float32([np.array([cols.flatten(), rows.flatten()]).transpose([1, 0])])
     coords_trans = cv2.perspectiveTransform(coords, M)
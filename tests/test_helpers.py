@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+
+from pyorc import helpers
+
+
+@pytest.mark.parametrize(
+    "x, y, angles",
+    [
+        # duplicate runs at start, middle and end of the points
+        (
+            [0., 0., 1., 1., 1., 2., 3., 3.],
+            [0., 0., 0., 0., 0., 1., 1., 1.],
+            [0.5 * np.pi] * 2 + [np.arctan2(2., 1.)] * 4 + [0.5 * np.pi] * 2
+        ),
+        (
+            [0., 1., 1., 1., 2., 3., 3.],
+            [0., 0., 0., 0., 1., 1., 1.],
+            [0.5 * np.pi] + [np.arctan2(2., 1.)] * 4 + [0.5 * np.pi] * 2
+        ),
+        # single point, no neighbours available
+        ([1.], [1.], [0.]),
+    ]
+)
+def test_xy_angle_duplicates(x, y, angles):
+    assert(np.allclose(helpers.xy_angle(np.array(x), np.array(y)), angles))
+
+
+def test_xy_angle():
+    np.random.seed(0)
+    x = np.random.rand(20)
+    y = np.random.rand(20)
+    # without duplicates, angles follow from central differences, and one-sided differences at the ends
+    angles = np.zeros(len(x))
+    angles[1:-1] = np.arctan2(x[2:] - x[0:-2], y[2:] - y[0:-2])
+    angles[0] = np.arctan2(x[1] - x[0], y[1] - y[0])
+    angles[-1] = np.arctan2(x[-1] - x[-2], y[-1] - y[-2])
+    assert(np.allclose(helpers.xy_angle(x, y), angles))
+
+
+def test_xy_to_perspective(cam_config):
+    M = cam_config.get_M(0., reverse=True, to_bbox_grid=True)
+    x = np.linspace(0.5, 8., 10)
+    y = np.linspace(1., 6., 10)
+    cols, rows = helpers.xy_to_perspective(x, y, 0.01, M, reverse_y=786)
+    # a stack of one matrix per coordinate must give the same result as the single matrix
+    cols_stack, rows_stack = helpers.xy_to_perspective(x, y, 0.01, np.stack([M] * len(x)), reverse_y=786)
+    assert(np.allclose(cols, cols_stack, atol=1e-3))
+    assert(np.allclose(rows, rows_stack, atol=1e-3))
+    with pytest.raises(AssertionError, match="transformation matrices"):
+        helpers.xy_to_perspective(x, y, 0.01, np.stack([M] * (len(x) - 1)), reverse_y=786)
@@ -2,6 +2,19 @@ import pytest
 import numpy as np
 import matplotlib.pyplot as plt
 
+from pyorc import helpers
+
+
+def test_vector_to_scalar(piv_transect):
+    piv_transect.transect.vector_to_scalar()
+    # effective velocity must equal the velocity magnitude, projected on the flow direction
+    v_angle = np.arctan2(piv_transect["v_x"], piv_transect["v_y"])
+    v_scalar = np.hypot(piv_transect["v_x"], piv_transect["v_y"])
+    v_eff = np.cos(v_angle - piv_transect["v_dir"]) * v_scalar
+    assert(piv_transect["v_eff_nofill"].dims == piv_transect["v_x"].dims)
+    assert(np.allclose(piv_transect["v_eff_nofill"], v_eff, equal_nan=True))
+
+
 def test_get_river_flow(piv_transect):
     # fill method is already tested in get_q, so choose default only
     piv_transect.transect.get_q()
@@ -43,3 +56,20 @@ def test_get_q(piv_transect, fill_method):
 def test_plot(piv_transect, mode, method):
     piv_transect.transect.get_q()
     piv_transect.isel(quantile=2).transect.plot(method=method, mode=mode, add_text=True)
+
+
+def test_get_uv_geographical(piv_transect):
+    piv_transect.transect.get_q()
+    ds = piv_transect.isel(quantile=2)
+    u, v, s = ds.transect.plot.get_uv_geographical()
+    # rotated components must equal rotation of the local components over the angle of the grid
+    aff = ds.transect.camera_config.transform
+    theta = np.arctan2(aff.d, aff.a)
+    u_exp, v_exp = helpers.rotate_u_v(
+        ds["v_eff"] * np.sin(ds["v_dir"]),
+        ds["v_eff"] * np.cos(ds["v_dir"]),
+        theta
+    )
+    assert(np.allclose(u, u_exp, equal_nan=True))
+    assert(np.allclose(v, v_exp, equal_nan=True))
+    assert(np.allclose(s, ds["v_eff"], equal_nan=True))
@@ -1,5 +1,6 @@
 import copy
 
+import dask.array
 import pytest
 import numpy as np
 import matplotlib.pyplot as plt
@@ -21,6 +22,30 @@ def test_get_transect(piv, cross_section, distance, nr_points):
     assert(len(ds_points.points)) == nr_points
 
 
+def test_get_transect_skipna(piv, cross_section):
+    x, y, z = cross_section["x"], cross_section["y"], cross_section["z"]
+    ds_points = piv.velocimetry.get_transect(x, y, z, crs=32735)
+    ds_points_nan = piv.velocimetry.get_transect(x, y, z, crs=32735, skipna=False)
+    # wherever no missings occur in time, results should be identical
+    idx = np.isfinite(ds_points_nan["v_eff_nofill"].values)
+    assert(idx.any())
+    assert(np.allclose(ds_points["v_eff_nofill"].values[idx], ds_points_nan["v_eff_nofill"].values[idx]))
+
+
+def test_get_transect_dask(piv, cross_section):
+    x, y, z = cross_section["x"], cross_section["y"], cross_section["z"]
+    # time series chunked per time step must be rechunked before quantiles can be derived
+    ds_points = piv.chunk({"time": 1}).velocimetry.get_transect(x, y, z, crs=32735, wdw=0)
+    ds_points_mem = piv.load().velocimetry.get_transect(x, y, z, crs=32735, wdw=0)
+    assert(np.allclose(ds_points["v_eff_nofill"], ds_points_mem["v_eff_nofill"], equal_nan=True))
+    # river flow must remain lazy on a chunked transect
+    for ds in [ds_points, ds_points_mem]:
+        ds.transect.get_q()
+        ds.transect.get_river_flow()
+    assert(isinstance(ds_points["river_flow"].data, dask.array.Array))
+    assert(np.allclose(ds_points["river_flow"], ds_points_mem["river_flow"]))
+
+
 @pytest.mark.parametrize(
     "mode",
     [